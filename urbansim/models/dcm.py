@@ -53,8 +53,8 @@ def unit_choice(chooser_ids, alternative_ids, probabilities):
     probabilities = np.asanyarray(probabilities)
 
     logger.debug(
-        'start: unit choice with {} choosers and {} alternatives'.format(
-            len(chooser_ids), len(alternative_ids)))
+        'start: unit choice with %s choosers and %s alternatives',
+        len(chooser_ids), len(alternative_ids))
 
     choices = pd.Series(index=chooser_ids)
 
@@ -316,7 +316,7 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
         if cfg.get('fit_parameters', None):
             model.fit_parameters = pd.DataFrame(cfg['fit_parameters'])
 
-        logger.debug('loaded LCM model {} from YAML'.format(model.name))
+        logger.debug('loaded LCM model %s from YAML', model.name)
         return model
 
     @property
@@ -393,7 +393,7 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
             model fit. Will have keys 'null', 'convergence', and 'ratio'.
 
         """
-        logger.debug('start: fit LCM model {}'.format(self.name))
+        logger.debug('start: fit LCM model %s', self.name)
 
         if not isinstance(current_choice, pd.Series):
             current_choice = choosers[current_choice]
@@ -423,7 +423,7 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
             model_design.as_matrix(), chosen, self.sample_size)
         self.fit_parameters.index = model_design.columns
 
-        logger.debug('finish: fit LCM model {}'.format(self.name))
+        logger.debug('finish: fit LCM model %s', self.name)
         return self.log_likelihoods
 
     @property
@@ -494,8 +494,8 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
             IDs in the inner index and chooser IDs in the out index.
 
         """
-        logger.debug('start: calculate probabilities for LCM model {}'.format(
-            self.name))
+        logger.debug(
+            'start: calculate probabilities for LCM model %s', self.name)
         self.assert_fitted()
 
         if filter_tables:
@@ -555,8 +555,8 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
             names=('chooser_id', 'alternative_id'))
         probabilities = pd.Series(probabilities.flatten(), index=mi)
 
-        logger.debug('finish: calculate probabilities for LCM model {}'.format(
-            self.name))
+        logger.debug(
+            'finish: calculate probabilities for LCM model %s', self.name)
         return probabilities
 
     def summed_probabilities(self, choosers, alternatives):
@@ -620,7 +620,7 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
 
         """
         self.assert_fitted()
-        logger.debug('start: predict LCM model {}'.format(self.name))
+        logger.debug('start: predict LCM model %s', self.name)
 
         choosers, alternatives = self.apply_predict_filters(
             choosers, alternatives)
@@ -653,7 +653,7 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
             raise ValueError(
                 'Unrecognized choice_mode option: {}'.format(self.choice_mode))
 
-        logger.debug('finish: predict LCM model {}'.format(self.name))
+        logger.debug('finish: predict LCM model %s', self.name)
         return choices
 
     def to_dict(self):
@@ -701,7 +701,7 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
             YAML is string if `str_or_buffer` is not given.
 
         """
-        logger.debug('serializing LCM model {} to YAML'.format(self.name))
+        logger.debug('serializing LCM model %s to YAML', self.name)
         if (not isinstance(self.probability_mode, str) or
                 not isinstance(self.choice_mode, str)):
             raise TypeError(
@@ -774,13 +774,13 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
         -------
         lcm : MNLDiscreteChoiceModel which was used to fit
         """
-        logger.debug('start: fit from configuration {}'.format(cfgname))
+        logger.debug('start: fit from configuration %s', cfgname)
         lcm = cls.from_yaml(str_or_buffer=cfgname)
         lcm.fit(choosers, alternatives, choosers[chosen_fname])
         lcm.report_fit()
         outcfgname = outcfgname or cfgname
         lcm.to_yaml(str_or_buffer=outcfgname)
-        logger.debug('finish: fit into configuration {}'.format(outcfgname))
+        logger.debug('finish: fit into configuration %s', outcfgname)
         return lcm
 
     @classmethod
@@ -817,7 +817,7 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
             for all the choosers.
         lcm : MNLDiscreteChoiceModel which was used to predict
         """
-        logger.debug('start: predict from configuration {}'.format(cfgname))
+        logger.debug('start: predict from configuration %s', cfgname)
         if cfgname:
             lcm = cls.from_yaml(str_or_buffer=cfgname)
         elif cfg:
@@ -843,7 +843,7 @@ class MNLDiscreteChoiceModel(DiscreteChoiceModel):
 
         new_units = lcm.predict(choosers, alternatives, debug=debug)
         print("Assigned %d choosers to new units" % len(new_units.dropna()))
-        logger.debug('finish: predict from configuration {}'.format(cfgname))
+        logger.debug('finish: predict from configuration %s', cfgname)
         return new_units, lcm
 
 
@@ -886,8 +886,7 @@ class MNLDiscreteChoiceModelGroup(DiscreteChoiceModel):
             in the choosers table.
 
         """
-        logger.debug(
-            'adding model {} to LCM group {}'.format(model.name, self.name))
+        logger.debug('adding model %s to LCM group %s', model.name, self.name)
         self.models[model.name] = model
 
     def add_model_from_params(
@@ -950,7 +949,7 @@ class MNLDiscreteChoiceModelGroup(DiscreteChoiceModel):
             the alternatives index is used.
 
         """
-        logger.debug('adding model {} to LCM group {}'.format(name, self.name))
+        logger.debug('adding model %s to LCM group %s', name, self.name)
         self.models[name] = MNLDiscreteChoiceModel(
             model_expression, sample_size,
             probability_mode, choice_mode,
@@ -979,8 +978,7 @@ class MNLDiscreteChoiceModelGroup(DiscreteChoiceModel):
         for name, group in groups:
             if name not in self.models:
                 continue
-            logger.debug(
-                'returning group {} in LCM group {}'.format(name, self.name))
+            logger.debug('returning group %s in LCM group %s', name, self.name)
             yield name, group
 
     def apply_fit_filters(self, choosers, alternatives):
@@ -1105,15 +1103,14 @@ class MNLDiscreteChoiceModelGroup(DiscreteChoiceModel):
 
         """
         logger.debug(
-            'start: calculate probabilities in LCM group {}'.format(self.name))
+            'start: calculate probabilities in LCM group %s', self.name)
         probs = {}
 
         for name, df in self._iter_groups(choosers):
             probs[name] = self.models[name].probabilities(df, alternatives)
 
         logger.debug(
-            'finish: calculate probabilities in LCM group {}'.format(
-                self.name))
+            'finish: calculate probabilities in LCM group %s', self.name)
         return probs
 
     def summed_probabilities(self, choosers, alternatives):
@@ -1139,8 +1136,7 @@ class MNLDiscreteChoiceModelGroup(DiscreteChoiceModel):
             return pd.Series()
 
         logger.debug(
-            'start: calculate summed probabilities in LCM group {}'.format(
-                self.name))
+            'start: calculate summed probabilities in LCM group %s', self.name)
         probs = []
 
         for name, df in self._iter_groups(choosers):
@@ -1151,8 +1147,8 @@ class MNLDiscreteChoiceModelGroup(DiscreteChoiceModel):
         probs = tz.reduce(add, probs)
 
         logger.debug(
-            'finish: calculate summed probabilities in LCM group {}'.format(
-                self.name))
+            'finish: calculate summed probabilities in LCM group %s',
+            self.name)
         return probs
 
     def predict(self, choosers, alternatives, debug=False):
@@ -1180,7 +1176,7 @@ class MNLDiscreteChoiceModelGroup(DiscreteChoiceModel):
             for all the choosers.
 
         """
-        logger.debug('start: predict models in LCM group {}'.format(self.name))
+        logger.debug('start: predict models in LCM group %s', self.name)
         results = []
 
         for name, df in self._iter_groups(choosers):
@@ -1190,8 +1186,7 @@ class MNLDiscreteChoiceModelGroup(DiscreteChoiceModel):
                     ~alternatives.index.isin(choices)]
             results.append(choices)
 
-        logger.debug(
-            'finish: predict models in LCM group {}'.format(self.name))
+        logger.debug('finish: predict models in LCM group %s', self.name)
         return pd.concat(results) if results else pd.Series()
 
     def choosers_columns_used(self):
@@ -1392,8 +1387,7 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
                 yamlio.convert_to_yaml(m, None))
             seg._group.add_model(model)
 
-        logger.debug(
-            'loaded segmented LCM model {} from YAML'.format(seg.name))
+        logger.debug('loaded segmented LCM model %s from YAML', seg.name)
         return seg
 
     def add_segment(self, name, model_expression=None):
@@ -1411,8 +1405,8 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
             None.
 
         """
-        logger.debug('adding LCM model {} to segmented model {}'.format(
-            name, self.name))
+        logger.debug(
+            'adding LCM model %s to segmented model %s', name, self.name)
         if not model_expression:
             if not self.default_model_expr:
                 raise ValueError(
@@ -1503,7 +1497,7 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
             log-liklihood values as returned by MNLDiscreteChoiceModel.fit.
 
         """
-        logger.debug('start: fit models in segmented LCM {}'.format(self.name))
+        logger.debug('start: fit models in segmented LCM %s', self.name)
 
         choosers, alternatives = self.apply_fit_filters(choosers, alternatives)
         unique = choosers[self.segmentation_col].unique()
@@ -1521,8 +1515,7 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
                 self.add_segment(x)
 
         results = self._group.fit(choosers, alternatives, current_choice)
-        logger.debug(
-            'finish: fit models in segmented LCM {}'.format(self.name))
+        logger.debug('finish: fit models in segmented LCM %s', self.name)
         return results
 
     @property
@@ -1563,14 +1556,12 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
 
         """
         logger.debug(
-            'start: calculate probabilities in segmented LCM {}'.format(
-                self.name))
+            'start: calculate probabilities in segmented LCM %s', self.name)
         choosers, alternatives = self.apply_predict_filters(
             choosers, alternatives)
         result = self._group.probabilities(choosers, alternatives)
         logger.debug(
-            'finish: calculate probabilities in segmented LCM {}'.format(
-                self.name))
+            'finish: calculate probabilities in segmented LCM %s', self.name)
         return result
 
     def summed_probabilities(self, choosers, alternatives):
@@ -1593,14 +1584,14 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
 
         """
         logger.debug(
-            'start: calculate summed probabilities in segmented LCM {}'.format(
-                self.name))
+            'start: calculate summed probabilities in segmented LCM %s',
+            self.name)
         choosers, alternatives = self.apply_predict_filters(
             choosers, alternatives)
         result = self._group.summed_probabilities(choosers, alternatives)
         logger.debug(
-            ('finish: calculate summed probabilities in segmented LCM {}'
-             ).format(self.name))
+            'finish: calculate summed probabilities in segmented LCM %s',
+            self.name)
         return result
 
     def predict(self, choosers, alternatives, debug=False):
@@ -1628,14 +1619,12 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
             for all the choosers.
 
         """
-        logger.debug(
-            'start: predict models in segmented LCM {}'.format(self.name))
+        logger.debug('start: predict models in segmented LCM %s', self.name)
         choosers, alternatives = self._filter_choosers_alts(
             choosers, alternatives)
 
         results = self._group.predict(choosers, alternatives, debug=debug)
-        logger.debug(
-            'finish: predict models in segmented LCM {}'.format(self.name))
+        logger.debug('finish: predict models in segmented LCM %s', self.name)
         return results
 
     def _process_model_dict(self, d):
@@ -1724,7 +1713,7 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
             YAML is string if `str_or_buffer` is not given.
 
         """
-        logger.debug('serializing segmented LCM {} to YAML'.format(self.name))
+        logger.debug('serializing segmented LCM %s to YAML', self.name)
         return yamlio.convert_to_yaml(self.to_dict(), str_or_buffer)
 
     def choosers_columns_used(self):
@@ -1792,7 +1781,7 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
         -------
         lcm : SegmentedMNLDiscreteChoiceModel which was used to fit
         """
-        logger.debug('start: fit from configuration {}'.format(cfgname))
+        logger.debug('start: fit from configuration %s', cfgname)
         lcm = cls.from_yaml(str_or_buffer=cfgname)
         lcm.fit(choosers, alternatives, choosers[chosen_fname])
         for k, v in lcm._group.models.items():
@@ -1800,7 +1789,7 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
             v.report_fit()
         outcfgname = outcfgname or cfgname
         lcm.to_yaml(str_or_buffer=outcfgname)
-        logger.debug('finish: fit into configuration {}'.format(outcfgname))
+        logger.debug('finish: fit into configuration %s', outcfgname)
         return lcm
 
     @classmethod
@@ -1835,7 +1824,7 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
             for all the choosers.
         lcm : SegmentedMNLDiscreteChoiceModel which was used to predict
         """
-        logger.debug('start: predict from configuration {}'.format(cfgname))
+        logger.debug('start: predict from configuration %s', cfgname)
         if cfgname:
             lcm = cls.from_yaml(str_or_buffer=cfgname)
         elif cfg:
@@ -1861,5 +1850,5 @@ class SegmentedMNLDiscreteChoiceModel(DiscreteChoiceModel):
 
         new_units = lcm.predict(choosers, alternatives, debug=debug)
         print("Assigned %d choosers to new units" % len(new_units.dropna()))
-        logger.debug('finish: predict from configuration {}'.format(cfgname))
+        logger.debug('finish: predict from configuration %s', cfgname)
         return new_units, lcm
@@ -294,7 +294,7 @@ class RegressionModel(object):
                 cfg['fit_rsquared'], cfg['fit_rsquared_adj'])
             model.fit_parameters = fit_parameters
 
-        logger.debug('loaded regression model {} from YAML'.format(model.name))
+        logger.debug('loaded regression model %s from YAML', model.name)
         return model
 
     @property
@@ -453,8 +453,7 @@ class RegressionModel(object):
             YAML string if `str_or_buffer` is not given.
 
         """
-        logger.debug(
-            'serializing regression model {} to YAML'.format(self.name))
+        logger.debug('serializing regression model %s to YAML', self.name)
         return yamlio.convert_to_yaml(self.to_dict(), str_or_buffer)
 
     def columns_used(self):
@@ -486,13 +485,13 @@ class RegressionModel(object):
         -------
         RegressionModel which was used to fit
         """
-        logger.debug('start: fit from configuration {}'.format(cfgname))
+        logger.debug('start: fit from configuration %s', cfgname)
         hm = cls.from_yaml(str_or_buffer=cfgname)
         ret = hm.fit(df, debug=debug)
         print(ret.summary())
         outcfgname = outcfgname or cfgname
         hm.to_yaml(str_or_buffer=outcfgname)
-        logger.debug('finish: fit into configuration {}'.format(outcfgname))
+        logger.debug('finish: fit into configuration %s', outcfgname)
         return hm
 
     @classmethod
@@ -513,13 +512,13 @@ class RegressionModel(object):
             models.
         hm : RegressionModel which was used to predict
         """
-        logger.debug('start: predict from configuration {}'.format(cfgname))
+        logger.debug('start: predict from configuration %s', cfgname)
         hm = cls.from_yaml(str_or_buffer=cfgname)
 
         price_or_rent = hm.predict(df)
         print(price_or_rent.describe())
 
-        logger.debug('start: predict from configuration {}'.format(cfgname))
+        logger.debug('start: predict from configuration %s', cfgname)
         return price_or_rent, hm
 
 
@@ -554,8 +553,7 @@ class RegressionModelGroup(object):
             the groupby segments.
 
         """
-        logger.debug(
-            'adding model {} to group {}'.format(model.name, self.name))
+        logger.debug('adding model %s to group %s', model.name, self.name)
         self.models[model.name] = model
 
     def add_model_from_params(self, name, fit_filters, predict_filters,
@@ -583,8 +581,7 @@ class RegressionModelGroup(object):
             By default no transformation is applied.
 
         """
-        logger.debug(
-            'adding model {} to group {}'.format(name, self.name))
+        logger.debug('adding model %s to group %s', name, self.name)
         model = RegressionModel(
             fit_filters, predict_filters, model_expression, ytransform, name)
         self.models[name] = model
@@ -764,7 +761,7 @@ class SegmentedRegressionModel(object):
             seg._group.add_model(reg)
 
         logger.debug(
-            'loaded segmented regression model {} from yaml'.format(seg.name))
+            'loaded segmented regression model %s from yaml', seg.name)
         return seg
 
     def add_segment(self, name, model_expression=None, ytransform='default'):
@@ -803,7 +800,7 @@ class SegmentedRegressionModel(object):
         self._group.add_model_from_params(
             name, None, None, model_expression, ytransform)
 
-        logger.debug('added segment {} to model {}'.format(name, self.name))
+        logger.debug('added segment %s to model %s', name, self.name)
 
     def fit(self, data, debug=False):
         """
@@ -949,8 +946,7 @@ class SegmentedRegressionModel(object):
 
         """
         logger.debug(
-            'serializing segmented regression model {} to yaml'.format(
-                self.name))
+            'serializing segmented regression model %s to yaml', self.name)
         return yamlio.convert_to_yaml(self.to_dict(), str_or_buffer)
 
     def columns_used(self):
@@ -986,7 +982,7 @@ class SegmentedRegressionModel(object):
         -------
         hm : SegmentedRegressionModel which was used to fit
         """
-        logger.debug('start: fit from configuration {}'.format(cfgname))
+        logger.debug('start: fit from configuration %s', cfgname)
         hm = cls.from_yaml(str_or_buffer=cfgname)
         if min_segment_size:
             hm.min_segment_size = min_segment_size
@@ -996,7 +992,7 @@ class SegmentedRegressionModel(object):
             print(v.summary())
         outcfgname = outcfgname or cfgname
         hm.to_yaml(str_or_buffer=outcfgname)
-        logger.debug('finish: fit into configuration {}'.format(outcfgname))
+        logger.debug('finish: fit into configuration %s', outcfgname)
         return hm
 
     @classmethod
@@ -1019,13 +1015,13 @@ class SegmentedRegressionModel(object):
             models.
         hm : SegmentedRegressionModel which was used to predict
         """
-        logger.debug('start: predict from configuration {}'.format(cfgname))
+        logger.debug('start: predict from configuration %s', cfgname)
         hm = cls.from_yaml(str_or_buffer=cfgname)
         if min_segment_size:
             hm.min_segment_size = min_segment_size
 
         price_or_rent = hm.predict(df)
         print(price_or_rent.describe())
-        logger.debug('finish: predict from configuration {}'.format(cfgname))
+        logger.debug('finish: predict from configuration %s', cfgname)
 
         return price_or_rent, hm
@@ -62,7 +62,7 @@ def find_movers(choosers, rates, rate_column):
 
     movers = relocation_rates.index[
         relocation_rates > np.random.random(len(choosers))]
-    logger.debug('picked {} movers for relocation'.format(len(movers)))
+    logger.debug('picked %s movers for relocation', len(movers))
     logger.debug('finish: find movers for relocation')
     return movers
 
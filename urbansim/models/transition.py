@@ -50,7 +50,7 @@ def add_rows(data, nrows, starting_index=None, accounting_column=None):
         will have multiple entries.
 
     """
-    logger.debug('start: adding {} rows in transition model'.format(nrows))
+    logger.debug('start: adding %s rows in transition model', nrows)
     if nrows == 0:
         return data, _empty_index(), _empty_index()
 
@@ -63,8 +63,7 @@ def add_rows(data, nrows, starting_index=None, accounting_column=None):
         starting_index, starting_index + len(new_rows.index), dtype=np.int))
     new_rows.index = added_index
 
-    logger.debug(
-        'finish: added {} rows in transition model'.format(len(new_rows)))
+    logger.debug('finish: added %s rows in transition model', len(new_rows))
     return pd.concat([data, new_rows]), added_index, copied_index
 
 
@@ -89,7 +88,7 @@ def remove_rows(data, nrows, accounting_column=None):
         Indexes of the rows removed from the table.
 
     """
-    logger.debug('start: removing {} rows in transition model'.format(nrows))
+    logger.debug('start: removing %s rows in transition model', nrows)
     nrows = abs(nrows)  # in case a negative number came in
     unit_check = data[accounting_column].sum() if accounting_column else len(data)
     if nrows == 0:
@@ -100,7 +99,7 @@ def remove_rows(data, nrows, accounting_column=None):
     remove_rows = sample_rows(nrows, data, accounting_column=accounting_column, replace=False)
     remove_index = remove_rows.index
 
-    logger.debug('finish: removed {} rows in transition model'.format(nrows))
+    logger.debug('finish: removed %s rows in transition model', nrows)
     return data.loc[data.index.difference(remove_index)], remove_index
 
 
@@ -290,7 +289,7 @@ class TabularGrowthRateTransition(object):
 
         # want this to be a DataFrame
         year_config = self._config_table.loc[[year]]
-        logger.debug('transitioning {} segments'.format(len(year_config)))
+        logger.debug('transitioning %s segments', len(year_config))
 
         segments = []
         added_indexes = []
@@ -517,7 +516,7 @@ class TransitionModel(object):
             updated, added, copied, removed = self.transitioner(data, year)
 
         for table_name, (table, col) in linked_tables.items():
-            logger.debug('updating linked table {}'.format(table_name))
+            logger.debug('updating linked table %s', table_name)
             updated_links[table_name] = \
                 _update_linked_table(table, col, added, copied, removed)
 
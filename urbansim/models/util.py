@@ -84,8 +84,7 @@ def _filterize(name, value):
 
     result = '{} {} {!r}'.format(name, comp, value)
     logger.debug(
-        'converted name={} and value={} to filter {}'.format(
-            name, value, result))
+        'converted name=%s and value=%s to filter %s', name, value, result)
     return result
 
 
@@ -199,7 +198,7 @@ def str_model_expression(expr, add_constant=True):
 
     """
     if not isinstance(expr, str):
-        if isinstance(expr, collections.Mapping):
+        if isinstance(expr, collections.abc.Mapping):
             left_side = expr.get('left_side')
             right_side = str_model_expression(expr['right_side'], add_constant)
         else:
@@ -222,8 +221,7 @@ def str_model_expression(expr, add_constant=True):
             model_expression += ' - 1'
 
     logger.debug(
-        'converted expression: {!r} to model: {!r}'.format(
-            expr, model_expression))
+        'converted expression: %r to model: %r', expr, model_expression)
     return model_expression
 
 
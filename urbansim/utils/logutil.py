@@ -22,9 +22,12 @@ def log_start_finish(msg, logger, level=logging.DEBUG):
         Level at which to log, passed to ``logger.log``.
 
     """
-    logger.log(level, 'start: ' + msg)
-    yield
-    logger.log(level, 'finish: ' + msg)
+    if logger.isEnabledFor(level):
+        logger.log(level, 'start: ' + msg)
+        yield
+        logger.log(level, 'finish: ' + msg)
+    else:
+        yield
 
 
 def set_log_level(level):
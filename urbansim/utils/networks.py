@@ -37,17 +37,17 @@ def from_yaml(net, cfgname):
         flds.append(node_col)
         if "filters" in variable:
             flds += util.columns_in_filters(variable["filters"])
-        logger.info("    Fields available to aggregate = " + ', '.join(flds))
+        logger.info("    Fields available to aggregate = %s", ', '.join(flds))
 
         df = orca.get_table(dfname).to_frame(flds)
 
         if "filters" in variable:
             df = util.apply_filter_query(df, variable["filters"])
-            logger.info("    Filters = %s" % variable["filters"])
+            logger.info("    Filters = %s", variable["filters"])
 
-        logger.info("    dataframe = %s, varname=%s" % (dfname, vname))
-        logger.info("    radius = %s, aggregation = %s, decay = %s" % (
-            radius, agg, decay))
+        logger.info("    dataframe = %s, varname=%s", dfname, vname)
+        logger.info("    radius = %s, aggregation = %s, decay = %s",
+                    radius, agg, decay)
 
         # set the variable
         net.set(df[node_col], variable=df[vname] if vname else None)
@@ -19,6 +19,7 @@ from .. import yamlio
 def test_cfg():
     return {
         'name': 'test',
+        'fit_filters': ['x > 1', 'y < 2'],
         'ytransform': 'xyz',
         'unordered': 'abc'
     }
@@ -28,6 +29,9 @@ def test_cfg():
 def expected_yaml():
     return (
         'name: test{newline}{newline}'
+        'fit_filters:{newline}'
+        '- x > 1{newline}'
+        '- y < 2{newline}{newline}'
         'ytransform: xyz{newline}{newline}'
         'unordered: abc{newline}'.format(newline='\n')
     )
@@ -123,7 +127,7 @@ def test_series_to_yaml_safe_int_index():
 
     assert d == {0: 100, 1: 101, 2: 102}
     y = yaml.dump(d, default_flow_style=False)
-    assert_series_equal(pd.Series(yaml.load(y)), s)
+    assert_series_equal(pd.Series(yaml.safe_load(y)), s)
 
 
 def test_series_to_yaml_safe_str_index():
@@ -133,7 +137,7 @@ def test_series_to_yaml_safe_str_index():
 
     assert d == {'x': 'a', 'y': 'b', 'z': 'c'}
     y = yaml.dump(d, default_flow_style=False)
-    assert_series_equal(pd.Series(yaml.load(y)), s)
+    assert_series_equal(pd.Series(yaml.safe_load(y)), s)
 
 
 def test_frame_to_yaml_safe():
@@ -146,7 +150,7 @@ def test_frame_to_yaml_safe():
     assert d == {'col1': {0: 100, 1: 200, 2: 300},
                  'col2': {0: 'a', 1: 'b', 2: 'c'}}
     y = yaml.dump(d, default_flow_style=False)
-    assert_dfs_equal(pd.DataFrame(yaml.load(y)), df)
+    assert_dfs_equal(pd.DataFrame(yaml.safe_load(y)), df)
 
 
 def test_ordered_dict():
@@ -8,11 +8,17 @@ except ImportError:
     pass
 import os
 import sys
-import numpy as np
 
+import numpy as np
 import yaml
 from collections import OrderedDict
 
+try:
+    # libyaml-backed implementations are typically 5-10x faster
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 
 if sys.version_info[0] < 3:
 
@@ -26,7 +32,7 @@ if sys.version_info[0] < 3:
         """
         return dumper.represent_int(data)
 
-    yaml.add_representer(long, __represent_long)
+    SafeDumper.add_representer(long, __represent_long)
 
 
 def series_to_yaml_safe(series, ordered=False):
@@ -46,13 +52,12 @@ def series_to_yaml_safe(series, ordered=False):
 
     """
     index = series.index.to_native_types(quoting=True)
-    values = series.values.tolist()
+    values = series.tolist()
 
     if ordered:
-        return OrderedDict(
-            tuple((k, v)) for k, v in zip(index, values))
+        return OrderedDict(zip(index, values))
     else:
-        return {i: v for i, v in zip(index, values)}
+        return dict(zip(index, values))
 
 
 def frame_to_yaml_safe(frame, ordered=False):
@@ -71,22 +76,23 @@ def frame_to_yaml_safe(frame, ordered=False):
     safe : dict or OrderedDict
 
     """
+    index = frame.index.to_native_types(quoting=True)
+    data = frame.to_dict('list')
+
     if ordered:
-        return OrderedDict(tuple((col, series_to_yaml_safe(series, True))
-                                 for col, series in frame.iteritems()))
+        return OrderedDict(
+            (col, OrderedDict(zip(index, values)))
+            for col, values in data.items())
     else:
-        return {col: series_to_yaml_safe(series)
-                for col, series in frame.iteritems()}
+        return {col: dict(zip(index, values))
+                for col, values in data.items()}
 
 
 def to_scalar_safe(obj):
     """
     Convert a numpy data type to a standard python scalar.
     """
-    try:
-        return np.asscalar(obj)
-    except Exception:
-        return obj
+    return obj.item() if hasattr(obj, 'item') else obj
 
 
 def ordered_yaml(cfg, order=None):
@@ -118,20 +124,22 @@ def ordered_yaml(cfg, order=None):
                  'model_expression', 'ytransform', 'min_segment_size',
                  'default_config', 'models', 'coefficients', 'fitted']
 
-    s = []
-    for key in order:
-        if key not in cfg:
-            continue
-        s.append(
-            yaml.dump({key: cfg[key]}, default_flow_style=False, indent=4))
+    ordered = OrderedDict((key, cfg[key]) for key in order if key in cfg)
+    ordered.update((key, cfg[key]) for key in cfg if key not in order)
+
+    dumped = yaml.dump(
+        ordered, Dumper=SafeDumper, default_flow_style=False, indent=4)
 
-    for key in cfg:
-        if key in order:
-            continue
-        s.append(
-            yaml.dump({key: cfg[key]}, default_flow_style=False, indent=4))
+    # separate top-level keys with blank lines to keep the output
+    # fairly human readable; block-sequence items are also emitted at
+    # column 0 and should stay attached to their key
+    s = []
+    for line in dumped.splitlines(True):
+        if s and not line[0].isspace() and not line.startswith('- '):
+            s.append('\n')
+        s.append(line)
 
-    return '\n'.join(s)
+    return ''.join(s)
 
 
 def __represent_ordereddict(dumper, data):
@@ -154,7 +162,37 @@ def __represent_ordereddict(dumper, data):
     return yaml.nodes.MappingNode(u'tag:yaml.org,2002:map', value)
 
 
-yaml.add_representer(OrderedDict, __represent_ordereddict)
+def __represent_np_int(dumper, data):
+    """
+    Write numpy integer scalars to yaml as plain ints.
+
+    """
+    return dumper.represent_int(int(data))
+
+
+def __represent_np_float(dumper, data):
+    """
+    Write numpy floating point scalars to yaml as plain floats.
+
+    """
+    return dumper.represent_float(float(data))
+
+
+def __represent_np_bool(dumper, data):
+    """
+    Write numpy booleans to yaml as plain bools.
+
+    """
+    return dumper.represent_bool(bool(data))
+
+
+# register on both the pure-Python and C safe dumpers so behavior
+# doesn't depend on whether libyaml is available
+for __dumper in {yaml.SafeDumper, SafeDumper}:
+    __dumper.add_representer(OrderedDict, __represent_ordereddict)
+    __dumper.add_multi_representer(np.integer, __represent_np_int)
+    __dumper.add_multi_representer(np.floating, __represent_np_float)
+    __dumper.add_multi_representer(np.bool_, __represent_np_bool)
 
 
 def convert_to_yaml(cfg, str_or_buffer):
@@ -220,7 +258,7 @@ def yaml_to_dict(yaml_str=None, str_or_buffer=None, ordered=False):
     if ordered:
         loader = __ordered_load
     else:
-        loader = yaml.load
+        loader = __safe_load
 
     if yaml_str:
         d = loader(yaml_str)
@@ -233,7 +271,15 @@ def yaml_to_dict(yaml_str=None, str_or_buffer=None, ordered=False):
     return d
 
 
-def __ordered_load(stream, Loader=yaml.Loader, object_pairs_hook=OrderedDict):
+def __safe_load(stream):
+    """
+    Loads yaml using the C safe loader when available.
+
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def __ordered_load(stream, Loader=SafeLoader, object_pairs_hook=OrderedDict):
     """
     Loads yaml into an OrderedDict.
 